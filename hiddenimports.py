@@ -38,4 +38,5 @@ hiddenimports = [
     "sentry_sdk.integrations.logging",
     "sentry_sdk.integrations.threading",
     "vnoise",
+    "orjson",
 ]
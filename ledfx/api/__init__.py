@@ -4,6 +4,7 @@ import uuid
 from json import JSONDecodeError
 
 import aiohttp_cors
+import orjson
 from aiohttp import web
 
 from ledfx.utils import BaseRegistry, RegistryLoader
@@ -26,7 +27,7 @@ class RestEndpoint(BaseRegistry):
         body = None
         if request.has_body:
             try:
-                body = await request.json()
+                body = await request.json(loads=orjson.loads)
             except JSONDecodeError:
                 body = await request.text()
             finally:
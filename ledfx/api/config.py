@@ -1,6 +1,8 @@
+import copy
 import logging
 from json import JSONDecodeError
 
+import orjson
 import voluptuous as vol
 from aiohttp import web
 
@@ -22,22 +24,76 @@ from ledfx.events import BaseConfigUpdateEvent
 
 _LOGGER = logging.getLogger(__name__)
 
-CORE_CONFIG_KEYS = set(map(str, CORE_CONFIG_SCHEMA.schema.keys()))
+# Seconds to wait for further updates before writing the config to disk
+SAVE_DEBOUNCE_DELAY = 1.0
+
+# Parsed once, imports are compared against it
+_CONFIGURATION_VERSION = parse_version(CONFIGURATION_VERSION)
+
+# Default config used when resetting, copied on use as it is mutated in place
+_DEFAULT_CORE_CONFIG = CORE_CONFIG_SCHEMA({})
+
+CORE_CONFIG_KEYS = frozenset(map(str, CORE_CONFIG_SCHEMA.schema.keys()))
+CORE_CONFIG_KEYS_NO_RESTART_SET = frozenset(CORE_CONFIG_KEYS_NO_RESTART)
+# Per-node permitted keys as frozensets for constant time membership checks
+# user_presets is accepted for every node
+_PERMITTED_KEYS = {
+    node: frozenset(keys) | {"user_presets"}
+    for node, keys in PERMITTED_KEYS.items()
+}
+
+# Complete config schema for imports, validating the nested sections in the
+# same pass as the core config. Sections that are null get their defaults,
+# the same as missing ones. The audio schema depends on the currently
+# available devices, so it is looked up when an import is validated rather
+# than compiled in here.
+_IMPORT_CONFIG_SCHEMA = CORE_CONFIG_SCHEMA.extend(
+    {
+        vol.Optional("wled_preferences", default={}): vol.All(
+            vol.DefaultTo({}), WLED_CONFIG_SCHEMA
+        ),
+        vol.Optional("melbanks", default={}): vol.All(
+            vol.DefaultTo({}), Melbanks.CONFIG_SCHEMA
+        ),
+        vol.Optional("audio", default={}): vol.All(
+            vol.DefaultTo({}),
+            lambda audio_config: AudioInputSource.AUDIO_CONFIG_SCHEMA.fget()(
+                audio_config
+            ),
+        ),
+    }
+)
 
 
 def validate_and_trim_config(config, schema, node):
-    for key in config.keys():
-        if key not in PERMITTED_KEYS[node] and key != "user_presets":
-            raise KeyError(f"Unknown/forbidden {node} config key: '{key}'")
+    if not isinstance(config, dict):
+        raise vol.MultipleInvalid(
+            [vol.Invalid(f"expected a dictionary for {node} config")]
+        )
+
+    # Nothing to validate - the trimmed result of an empty config is always
+    # empty, so skip the (comparatively expensive) schema walk entirely
+    if config == {}:
+        return {}
+
+    forbidden_keys = config.keys() - _PERMITTED_KEYS[node]
+    if forbidden_keys:
+        # report the first offending key in request order, not set order
+        forbidden_key = next(key for key in config if key in forbidden_keys)
+        raise KeyError(
+            f"Unknown/forbidden {node} config key: '{forbidden_key}'"
+        )
 
     validated_config = schema(config)
-    return {key: validated_config[key] for key in config.keys()}
+    return {key: validated_config[key] for key in config}
 
 
 class ConfigEndpoint(RestEndpoint):
     ENDPOINT_PATH = "/api/config"
 
-    async def get(self, request: web.Request) -> web.Response:
+    _pending_save = None
+
+    async def get(self, request: web.Request) -> web.StreamResponse:
         """
         Get complete ledfx config.
         You may ask for a specific key/keys in the request body
@@ -48,13 +104,13 @@ class ConfigEndpoint(RestEndpoint):
         - request (web.Request): The request object.
 
         Returns:
-        - web.Response: The response object containing the ledfx config.
+        - web.StreamResponse: The streamed response containing the ledfx config.
         """
         keys = set()
 
         if request.can_read_body:
             try:
-                wanted_keys = await request.json()
+                wanted_keys = await request.json(loads=orjson.loads)
             except JSONDecodeError:
                 return await self.json_decode_error()
 
@@ -81,7 +137,56 @@ class ConfigEndpoint(RestEndpoint):
                 config = WLED_CONFIG_SCHEMA(config)
 
             response[key] = config
-        return await self.bare_request_success(response)
+        return await self.stream_request_success(request, response)
+
+    async def stream_request_success(
+        self, request: web.Request, payload: dict
+    ) -> web.StreamResponse:
+        """
+        Streams a "bare" JSON object response indicating a successful request - only a payload and a 200 code.
+        Each top level key is serialized and sent as its own chunk, so the full
+        config never has to be held in memory as a single JSON document.
+
+        Args:
+            request (web.Request): The request being responded to.
+            payload (dict): The payload to be returned.
+
+        Returns:
+            web.StreamResponse: A chunked JSON response containing the payload.
+        """
+        chunks = (
+            orjson.dumps(key)
+            + b":"
+            + orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+            for key, value in payload.items()
+        )
+        # Serialize the first chunk before the response is started, so a
+        # failure there can still be reported as a normal error response
+        first_chunk = next(chunks, None)
+
+        response = web.StreamResponse()
+        response.content_type = "application/json"
+        await response.prepare(request)
+
+        if first_chunk is None:
+            await response.write(b"{}")
+        else:
+            await response.write(b"{" + first_chunk)
+            try:
+                for chunk in chunks:
+                    await response.write(b"," + chunk)
+            except orjson.JSONEncodeError as e:
+                # The 200 has already been sent - drop the connection so the
+                # client sees a failed request rather than truncated JSON
+                _LOGGER.error(
+                    f"Failed to serialize config, aborting response: {e}"
+                )
+                if request.transport is not None:
+                    request.transport.close()
+                return response
+            await response.write(b"}")
+        await response.write_eof()
+        return response
 
     async def delete(self) -> web.Response:
         """
@@ -90,8 +195,9 @@ class ConfigEndpoint(RestEndpoint):
         Returns:
             web.Response: The response indicating the success of the operation.
         """
-        create_backup(self._ledfx.config_dir, "DELETE")
-        self._ledfx.config = CORE_CONFIG_SCHEMA({})
+        self._cancel_pending_save()
+        await self._create_backup("DELETE")
+        self._ledfx.config = copy.deepcopy(_DEFAULT_CORE_CONFIG)
 
         save_config(
             config=self._ledfx.config,
@@ -115,12 +221,15 @@ class ConfigEndpoint(RestEndpoint):
 
         """
         try:
-            config = await request.json()
+            config = await request.json(loads=orjson.loads)
 
             try:
-                assert parse_version(
-                    config["configuration_version"]
-                ) == parse_version(CONFIGURATION_VERSION)
+                import_version = config["configuration_version"]
+                # Matching strings are by far the common case - only parse if they differ
+                assert (
+                    import_version == CONFIGURATION_VERSION
+                    or parse_version(import_version) == _CONFIGURATION_VERSION
+                )
             except (KeyError, AssertionError):
                 _LOGGER.warning(
                     f"LedFx config version: {CONFIGURATION_VERSION}, import config version: {config.get('configuration_version', 'UNDEFINED (old!)')}"
@@ -132,26 +241,14 @@ class ConfigEndpoint(RestEndpoint):
                     _LOGGER.exception(msg)
                     return await self.internal_error(msg, "error")
 
+            config = _IMPORT_CONFIG_SCHEMA(config)
+
             # if we got this far, we are happy with and committing to the import config
             # so backup the old one
-            create_backup(self._ledfx.config_dir, "IMPORT")
-
-            audio_config = AudioInputSource.AUDIO_CONFIG_SCHEMA.fget()(
-                config.pop("audio", {})
-            )
-            wled_config = WLED_CONFIG_SCHEMA(
-                config.pop("wled_preferences", {})
-            )
-            melbanks_config = Melbanks.CONFIG_SCHEMA(
-                config.pop("melbanks", {})
-            )
-            core_config = CORE_CONFIG_SCHEMA(config)
-
-            core_config["audio"] = audio_config
-            core_config["wled_preferences"] = wled_config
-            core_config["melbanks"] = melbanks_config
+            self._cancel_pending_save()
+            await self._create_backup("IMPORT")
 
-            self._ledfx.config = core_config
+            self._ledfx.config = config
 
             save_config(
                 config=self._ledfx.config,
@@ -181,19 +278,18 @@ class ConfigEndpoint(RestEndpoint):
         """
 
         try:
-            config = await request.json()
+            config = await request.json(loads=orjson.loads)
         except JSONDecodeError:
             return await self.json_decode_error()
         except Exception as e:
             return await self.generic_error(str(e))
 
         try:
-            self.update_config(config)
-            save_config(
-                config=self._ledfx.config, config_dir=self._ledfx.config_dir
-            )
-            need_restart = self.check_need_restart(config)
+            core_config = self.update_config(config)
+            need_restart = self._core_needs_restart(core_config)
             if need_restart:
+                # Make sure the new config is on disk before restarting
+                self._flush_pending_save()
                 # Ugly - return success to frontend before restarting
                 try:
                     return await self.request_success(
@@ -202,6 +298,7 @@ class ConfigEndpoint(RestEndpoint):
                     )
                 finally:
                     self._ledfx.loop.call_soon_threadsafe(self._ledfx.stop, 4)
+            self._save_config_debounced()
             return await self.request_success(
                 type="success", message="Configuration Updated"
             )
@@ -220,21 +317,21 @@ class ConfigEndpoint(RestEndpoint):
             config (dict): The new configuration to be applied.
 
         Returns:
-            None
+            dict: The validated core config that was applied.
         """
         audio_config = config.pop("audio", {})
 
-        audio_config = validate_and_trim_config(
-            audio_config,
-            AudioInputSource.AUDIO_CONFIG_SCHEMA.fget(),
-            "audio",
-        )
-
-        audio_config = validate_and_trim_config(
-            audio_config,
-            AudioAnalysisSource.CONFIG_SCHEMA,
-            "audio",
-        )
+        # Building the audio schema queries the sound devices, so only do it
+        # when there is actually some audio config to validate
+        if audio_config != {}:
+            audio_config = validate_and_trim_config(
+                audio_config,
+                AudioInputSource.AUDIO_CONFIG_SCHEMA.fget(),
+                "audio",
+            )
+            audio_config = validate_and_trim_config(
+                audio_config, AudioAnalysisSource.CONFIG_SCHEMA, "audio"
+            )
         wled_config = validate_and_trim_config(
             config.pop("wled_preferences", {}),
             WLED_CONFIG_SCHEMA,
@@ -249,6 +346,11 @@ class ConfigEndpoint(RestEndpoint):
 
         self._ledfx.config["audio"].update(audio_config)
         self._ledfx.config["melbanks"].update(melbanks_config)
+        # Only listeners of core config changes need to know about this update
+        core_changed = any(
+            self._ledfx.config.get(key) != value
+            for key, value in core_config.items()
+        )
         self._ledfx.config.update(core_config)
 
         # handle special case wled_preferences nested dict
@@ -260,40 +362,85 @@ class ConfigEndpoint(RestEndpoint):
             else:
                 self._ledfx.config["wled_preferences"][key] = wled_config[key]
 
-        if (
-            hasattr(self._ledfx, "audio")
-            and self._ledfx.audio is not None
-            and audio_config
-        ):
-            self._ledfx.audio.update_config(self._ledfx.config["audio"])
+        audio = getattr(self._ledfx, "audio", None)
+        if audio is not None and audio_config:
+            audio.update_config(self._ledfx.config["audio"])
 
-        if hasattr(self._ledfx, "audio") and melbanks_config:
-            self._ledfx.audio.melbanks.update_config(
-                self._ledfx.config["melbanks"]
-            )
+        if audio is not None and melbanks_config:
+            audio.melbanks.update_config(self._ledfx.config["melbanks"])
 
-        self._ledfx.events.fire_event(BaseConfigUpdateEvent(config))
+        if core_changed:
+            self._ledfx.events.fire_event(BaseConfigUpdateEvent(config))
 
-    def check_need_restart(self, config):
+        return core_config
+
+    def _core_needs_restart(self, core_config):
         """
-        Checks if a restart is needed based on the provided configuration.
+        Checks if a restart is needed to apply an already validated core config.
 
         Args:
-            config (dict): The configuration to be checked.
+            core_config (dict): The validated core config, as returned by update_config.
 
         Returns:
             bool: True if a restart is needed, False otherwise.
         """
-        core_config = validate_and_trim_config(
-            config, CORE_CONFIG_SCHEMA, "core"
+        # If core_config is empty, no restart is needed
+        return bool(core_config) and core_config.keys().isdisjoint(
+            CORE_CONFIG_KEYS_NO_RESTART_SET
         )
 
-        # If core_config is empty, no restart is needed
-        if not core_config:
-            return False
+    def _save_config_debounced(self, delay=SAVE_DEBOUNCE_DELAY):
+        """
+        Schedules a save of the ledfx config, replacing any save that is still pending.
+        A burst of updates therefore results in a single write to disk.
 
-        need_restart = True
-        if any(key in core_config for key in CORE_CONFIG_KEYS_NO_RESTART):
-            need_restart = False
+        Args:
+            delay (float): Seconds to wait before saving. Defaults to SAVE_DEBOUNCE_DELAY.
+        """
+        self._cancel_pending_save()
+        self._pending_save = self._ledfx.loop.call_later(
+            delay, self._run_pending_save
+        )
 
-        return need_restart
+    def _run_pending_save(self):
+        """
+        Runs a debounced save. The client was already told the update succeeded,
+        so a failure can only be logged.
+        """
+        try:
+            self._flush_pending_save()
+        except Exception as e:
+            _LOGGER.exception(f"Failed to save the LedFx config: {e}")
+
+    def _flush_pending_save(self):
+        """
+        Cancels any pending save and saves the ledfx config immediately.
+        """
+        self._cancel_pending_save()
+        save_config(
+            config=self._ledfx.config, config_dir=self._ledfx.config_dir
+        )
+
+    async def _create_backup(self, backup_reason):
+        """
+        Backs up the config file on the thread executor.
+        This is awaited rather than fired and forgotten, as the backup moves the
+        config file aside and must complete before the new config is saved.
+
+        Args:
+            backup_reason (str): The reason for the backup, see CONFIG_BACKUP_REASONS.
+        """
+        await self._ledfx.loop.run_in_executor(
+            self._ledfx.thread_executor,
+            create_backup,
+            self._ledfx.config_dir,
+            backup_reason,
+        )
+
+    def _cancel_pending_save(self):
+        """
+        Cancels a pending debounced save, if there is one.
+        """
+        if self._pending_save is not None:
+            self._pending_save.cancel()
+            self._pending_save = None
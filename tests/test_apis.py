@@ -5,11 +5,12 @@ import pytest
 # Remember to import the test groups here if you add a new one
 from conftest import all_effects, audio_configs
 
+from tests.test_definitions.config import config_tests
 from tests.test_definitions.devices import device_tests
 from tests.test_definitions.effects import effect_tests
 from tests.test_definitions.proof_of_life import proof_of_life_tests
 from tests.test_utilities.consts import SERVER_PATH
-from tests.test_utilities.test_utils import HTTPSession
+from tests.test_utilities.test_utils import EnvironmentCleanup, HTTPSession
 
 
 @pytest.fixture
@@ -31,6 +32,7 @@ test_groups = [
     ("effect_tests", effect_tests),
     ("all_effects", all_effects),
     ("audio_configs", audio_configs),
+    ("config_tests", config_tests),
 ]
 
 # Define a list of all test cases
@@ -82,6 +84,8 @@ def test_api(group_name, test_name, case, http_session):
                     ), f"Expected {key} to be {value}, but got {response_dict.get(key)}"
     if case.sleep_after_test:
         time.sleep(case.sleep_after_test)
+    if case.wait_for_restart:
+        EnvironmentCleanup.wait_for_ledfx_restart()
 
 
 if __name__ == "__main__":
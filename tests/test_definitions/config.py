@@ -0,0 +1,94 @@
+# Broadly, this will use our internal HTTP APIs to:
+# 1. Update the wled preferences
+# 2. Check that the config reflects the update
+# 3. Request a subset of the config keys
+# 4. Check that updates with a null section are rejected
+# 5. Import a config with a null section, which restarts LedFx
+# 6. Check that the null section was given its defaults
+from ledfx.consts import CONFIGURATION_VERSION
+from tests.test_utilities.test_utils import APITestCase
+
+config_tests = {
+    "update_wled_preferences": APITestCase(
+        execution_order=1,
+        method="PUT",
+        api_endpoint="/api/config",
+        expected_return_code=200,
+        payload_to_send={
+            "wled_preferences": {
+                "wled_preferred_mode": {
+                    "setting": "DDP",
+                    "user_enabled": True,
+                }
+            }
+        },
+        expected_response_keys=["status", "payload"],
+        expected_response_values=[{"status": "success"}],
+    ),
+    "get_updated_wled_preferences": APITestCase(
+        execution_order=2,
+        method="GET",
+        api_endpoint="/api/config",
+        expected_return_code=200,
+        expected_response_keys=["wled_preferences"],
+        expected_response_values=[
+            {
+                "wled_preferences": {
+                    "wled_preferred_mode": {
+                        "setting": "DDP",
+                        "user_enabled": True,
+                    }
+                }
+            }
+        ],
+    ),
+    "get_config_key_list": APITestCase(
+        execution_order=3,
+        method="GET",
+        api_endpoint="/api/config",
+        expected_return_code=200,
+        payload_to_send=["audio", "melbanks", "wled_preferences"],
+        expected_response_keys=["audio", "melbanks", "wled_preferences"],
+    ),
+    "update_null_melbanks": APITestCase(
+        execution_order=4,
+        method="PUT",
+        api_endpoint="/api/config",
+        expected_return_code=200,
+        payload_to_send={"melbanks": None},
+        expected_response_keys=["status", "payload"],
+        expected_response_values=[{"status": "failed"}],
+    ),
+    "update_null_audio": APITestCase(
+        execution_order=5,
+        method="PUT",
+        api_endpoint="/api/config",
+        expected_return_code=200,
+        payload_to_send={"audio": None},
+        expected_response_keys=["status", "payload"],
+        expected_response_values=[{"status": "failed"}],
+    ),
+    "import_config_null_melbanks": APITestCase(
+        execution_order=6,
+        method="POST",
+        api_endpoint="/api/config",
+        expected_return_code=200,
+        payload_to_send={
+            "configuration_version": CONFIGURATION_VERSION,
+            "melbanks": None,
+        },
+        expected_response_keys=["status"],
+        expected_response_values=[{"status": "success"}],
+        # Importing a config restarts LedFx
+        wait_for_restart=True,
+    ),
+    "get_imported_melbanks_defaults": APITestCase(
+        execution_order=7,
+        method="GET",
+        api_endpoint="/api/config",
+        expected_return_code=200,
+        payload_to_send="melbanks",
+        expected_response_keys=["melbanks"],
+        expected_response_values=[{"melbanks": {"samples": 24}}],
+    ),
+}
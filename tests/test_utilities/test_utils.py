@@ -24,20 +24,22 @@ class APITestCase:
         method (str): The HTTP method to be used for the API request.
         api_endpoint (str): The endpoint of the API to be tested, including the leading slash.
         expected_return_code (int): The expected return code of the API response.
-        payload_to_send (Dict[str, Any], optional): The payload to be sent with the API request.
+        payload_to_send (Union[Dict[str, Any], List[Any], str], optional): The payload to be sent with the API request.
         expected_response_keys (List[str], optional): The expected keys in the API response payload. You don't need to specify the entire payload, just the keys you want to check.
         expected_payload_values (List[Dict[str, Any]], optional): The expected values in the API response payload. You don't need to specify the entire payload, just the key:values you want to check.
         sleep_after_test (float, optional): The number of seconds to sleep after the test is complete. Defaults to 0.0. This is useful for tests that require a delay before the next test can be run.
+        wait_for_restart (bool, optional): Whether to wait for LedFx to restart after the test is complete. Defaults to False. This is needed for tests of requests that restart LedFx.
     """
 
     execution_order: int
     method: Literal["GET", "POST", "PUT", "DELETE"]
     api_endpoint: str
     expected_return_code: int
-    payload_to_send: dict[str, Any] = None
+    payload_to_send: Union[dict[str, Any], list[Any], str] = None
     expected_response_keys: list[str] = None
     expected_response_values: list[dict[str, Any]] = None
     sleep_after_test: float = 0
+    wait_for_restart: bool = False
 
 
 class HTTPSession:
@@ -89,7 +91,7 @@ class HTTPSession:
         return session
 
     def send_test_api_request(
-        self, url, method, payload: Optional[Union[str, dict]] = None
+        self, url, method, payload: Optional[Union[str, dict, list]] = None
     ):
         """
         Sends a test API request to the specified URL using the specified HTTP method.
@@ -97,7 +99,7 @@ class HTTPSession:
         Args:
             url (str): The URL to send the request to.
             method (str): The HTTP method to use for the request (GET, POST, PUT, DELETE).
-            payload (Optional[Union[str, dict]], optional): The payload to include in the request. Defaults to None.
+            payload (Optional[Union[str, dict, list]], optional): The payload to include in the request. Defaults to None.
 
         Returns:
             requests.Response: The response object containing the server's response to the request.
@@ -109,7 +111,7 @@ class HTTPSession:
         headers = {"Content-Type": "application/json"}
         try:
             if method == "GET":
-                response = self.session.get(url, headers=headers)
+                response = self.session.get(url, json=payload, headers=headers)
             elif method == "POST":
                 response = self.session.post(
                     url, json=payload, headers=headers
@@ -183,6 +185,31 @@ class EnvironmentCleanup:
         else:
             pytest.fail("Unable to remove the test config folder.")
 
+    @staticmethod
+    def wait_for_ledfx_restart(timeout=30):
+        """
+        Waits for LedFx to stop responding and then come back up, for use after a request that restarts it.
+
+        Args:
+            timeout (float): The number of seconds to wait for the restart before failing the test.
+
+        Returns:
+            None
+        """
+        deadline = time.monotonic() + timeout
+        # The restart is scheduled after the response is sent, so wait for the old instance to go away first
+        while time.monotonic() < deadline:
+            try:
+                requests.get(f"http://{SERVER_PATH}/api/info", timeout=1)
+            except requests.exceptions.RequestException:
+                break
+            time.sleep(0.1)
+        while time.monotonic() < deadline:
+            if EnvironmentCleanup.ledfx_is_alive():
+                return
+            time.sleep(0.5)
+        pytest.fail(f"LedFx did not restart within {timeout} seconds.")
+
     @staticmethod
     def ledfx_is_alive():
         """